@@ -8,6 +8,7 @@ import logging
 import os
 import sys
 import tarfile
+import time
 import zipfile
 
 from contextlib import contextmanager
@@ -179,7 +180,7 @@ class Installer:
         else:
             LOGGER.info(*logmsg)
             LOGGER.info(args)
-            _execute(args)
+            self.results['install'] = self.runpip(args)
 
     # def installpackage(self):
     #     """Install package archive with pip."""
@@ -271,7 +272,7 @@ class Installer:
     def promptuninstall(self):
         """Prompt to uninstall package archive."""
 
-        self.results = self.showpackage()
+        self.results = self.showpackage() or {}
 
         if self.results:
             LOGGER.info("Identified installed package: '%s'", self.pkgname)
@@ -327,6 +328,21 @@ class Installer:
 
         return results
 
+    def runpip(self, args):
+        """Run a pip command and abort if it fails."""
+
+        result = _execute(args)
+
+        LOGGER.info("Command exited with status %d after %.2f seconds",
+                    result['returncode'], result['duration'])
+
+        if result['returncode'] != 0:
+            LOGGER.critical("Command failed with exit status %d: %s",
+                            result['returncode'], args)
+            sys.exit(result['returncode'])
+
+        return result
+
     # def showpackage(self):
     #     """Return a set of details for an installed package."""
 
@@ -341,10 +357,8 @@ class Installer:
     def uninstallpackage(self):
         """Uninstall package archive with pip."""
 
-        args = [self.options.pipv, 'uninstall', self.pkgname]
-
-        if self.options.auto:
-            args.insert(0, 'echo y |')
+        # confirmation has already been obtained by promptuninstall
+        args = [self.options.pipv, 'uninstall', '--yes', self.pkgname]
 
         logmsg = "Uninstalling %s %s", self.pkgname, self.results['version']
 
@@ -354,7 +368,7 @@ class Installer:
         else:
             LOGGER.info(*logmsg)
             LOGGER.info(args)
-            _execute(args)
+            self.results['uninstall'] = self.runpip(args)
 
     # def uninstallpackage(self):
     #     """Uninstall package archive with pip."""
@@ -423,8 +437,33 @@ def null():
 
 
 def _execute(args):
-    """Execute shell commands with access to terminal."""
-    os.system(' '.join(args))
+    """
+    Execute a command without a shell and stream its output to the log.
+    Return a dict containing the command's exit status and duration.
+    """
+
+    import subprocess
+
+    start = time.monotonic()
+
+    process = subprocess.Popen(args,
+                               bufsize=1,
+                               stdin=subprocess.DEVNULL,
+                               stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT,
+                               universal_newlines=True)
+
+    with process.stdout:
+        for line in iter(process.stdout.readline, ''):
+            OUTPUT.info(line.rstrip('\n'))
+
+    returncode = process.wait()
+
+    return {
+        'args': args,
+        'returncode': returncode,
+        'duration': time.monotonic() - start
+    }
 
 
 def _parser(args):
@@ -614,5 +653,13 @@ FORMAT = logging.Formatter('(%(name)s) %(levelname)s: %(message)s')
 STREAM.setFormatter(FORMAT)
 LOGGER.addHandler(STREAM)
 
+# configure logger for the output of executed commands
+OUTPUT = LOGGER.getChild('output')
+OUTPUT.propagate = False
+OUTPUT.setLevel(logging.INFO)
+OUTPUT_STREAM = logging.StreamHandler()
+OUTPUT_STREAM.setFormatter(logging.Formatter('%(message)s'))
+OUTPUT.addHandler(OUTPUT_STREAM)
+
 if __name__ == '__main__':
     main()